@@ -13,15 +13,13 @@
 # limitations under the License.
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-from deprecate import void
 from torchmetrics import Metric
 
 import pytorch_lightning as pl
 from pytorch_lightning.trainer.connectors.logger_connector.result import ResultCollection
-from pytorch_lightning.trainer.progress import BaseProgress, Progress
-from pytorch_lightning.utilities.apply_func import apply_to_collection
+from pytorch_lightning.trainer.progress import _RESET_ON_RESTART_TYPES, _reset_progress_on_restart, BaseProgress
 from pytorch_lightning.utilities.exceptions import MisconfigurationException
 
 
@@ -46,6 +44,11 @@ class Loop(ABC):
         on_run_end()
     """
 
+    # the fixed fields of the base loop are kept out of the instance ``__dict__``, which only holds the attributes
+    # defined by subclasses. This way, the child loops and progress trackers discovered there are not mixed with
+    # internal state and ``restarting``, written on every iteration of :meth:`run`, is a plain slot store.
+    __slots__ = ("restarting", "_trainer")
+
     def __init__(self) -> None:
         self.restarting = False
         self._trainer: Optional["pl.Trainer"] = None
@@ -64,9 +67,19 @@ class Loop(ABC):
                 f"Loop {self.__class__.__name__} should be connected to a `Trainer`, found: {trainer}."
             )
         self._trainer = trainer
-        for v in self.__dict__.values():
-            if isinstance(v, Loop):
-                v.trainer = trainer
+        # the children are attached in a single pass over the tree, without validating the trainer again. Children
+        # overriding the `trainer` property are connected through their setter, which takes care of their own children
+        stack = [self]
+        while stack:
+            loop = stack.pop()
+            for v in loop.__dict__.values():
+                if not isinstance(v, Loop):
+                    continue
+                if type(v).trainer is Loop.trainer:
+                    v._trainer = trainer
+                    stack.append(v)
+                else:
+                    v.trainer = trainer
 
     @property
     @abstractmethod
@@ -105,13 +118,27 @@ class Loop(ABC):
 
         self.reset()
 
-        self.on_run_start(*args, **kwargs)
+        on_run_start = self.on_run_start
+        if not _is_default_hook(on_run_start, Loop.on_run_start):
+            on_run_start(*args, **kwargs)
+
+        # resolve the bound methods once instead of on each iteration. The hooks which are not overridden are no-ops
+        # and are not called at all
+        on_advance_start = self.on_advance_start
+        if _is_default_hook(on_advance_start, Loop.on_advance_start):
+            on_advance_start = None
+        advance = self.advance
+        on_advance_end = self.on_advance_end
+        if _is_default_hook(on_advance_end, Loop.on_advance_end):
+            on_advance_end = None
 
         while not self.done:
             try:
-                self.on_advance_start(*args, **kwargs)
-                self.advance(*args, **kwargs)
-                self.on_advance_end()
+                if on_advance_start is not None:
+                    on_advance_start(*args, **kwargs)
+                advance(*args, **kwargs)
+                if on_advance_end is not None:
+                    on_advance_end()
                 self.restarting = False
             except StopIteration:
                 break
@@ -128,14 +155,12 @@ class Loop(ABC):
 
         Accepts all arguments passed to :attr:`run`.
         """
-        void(*args, **kwargs)
 
     def on_advance_start(self, *args: Any, **kwargs: Any) -> None:
         """Hook to be called each time before :attr:`advance` is called.
 
         Accepts all arguments passed to :attr`run`.
         """
-        void(*args, **kwargs)
 
     @abstractmethod
     def advance(self, *args: Any, **kwargs: Any) -> None:
@@ -178,19 +203,22 @@ class Loop(ABC):
         if destination is None:
             destination = {}
 
-        destination[prefix + "state_dict"] = self.on_save_checkpoint()
+        for loop_prefix, loop, overridden in self._flatten("state_dict", prefix):
+            if overridden:
+                loop.state_dict(destination, loop_prefix)
+                continue
 
-        for k, v in self.__dict__.items():
-            key = prefix + k
-            if isinstance(v, BaseProgress):
-                destination[key] = v.state_dict()
-            elif isinstance(v, Loop):
-                v.state_dict(destination, key + ".")
-            elif isinstance(v, ResultCollection):
-                # sync / unsync metrics
-                v.sync()
-                destination[key] = v.state_dict()
-                v.unsync()
+            # the view is resolved once for both passes over the loop attributes
+            attributes = loop.__dict__.items()
+            destination[loop_prefix + "state_dict"] = loop.on_save_checkpoint()
+            destination.update({loop_prefix + k: v.state_dict() for k, v in attributes if isinstance(v, BaseProgress)})
+
+            for k, v in attributes:
+                if isinstance(v, ResultCollection):
+                    # sync / unsync metrics
+                    v.sync()
+                    destination[loop_prefix + k] = v.state_dict()
+                    v.unsync()
 
         return destination
 
@@ -202,10 +230,38 @@ class Loop(ABC):
         metrics: Optional[Dict[str, Metric]] = None,
     ) -> None:
         """Loads the state of this loop and all its children."""
-        self._load_from_state_dict(state_dict.copy(), prefix, restart_progress, metrics)
-        for k, v in self.__dict__.items():
-            if isinstance(v, Loop):
-                v.load_state_dict(state_dict.copy(), prefix + k + ".", restart_progress)
+        for loop_prefix, loop, overridden in self._flatten("load_state_dict", prefix):
+            if overridden:
+                loop.load_state_dict(state_dict, loop_prefix, restart_progress)
+                continue
+
+            # the metrics are only provided to this loop, not to its children
+            loop._load_from_state_dict(state_dict, loop_prefix, restart_progress, metrics if loop is self else None)
+
+    def _flatten(self, method: str, prefix: str = "") -> List[Tuple[str, "Loop", bool]]:
+        """Collects this loop and all its children, depth first, along with the prefix of their state dict keys.
+
+        The tree is walked iteratively so that saving and loading deeply nested loops does not recurse. A child whose
+        ``method`` is overridden, by its class or on the instance, is returned flagged as overridden and its own
+        children are not collected, so the caller can delegate to the override as the recursive implementation did.
+        """
+        base_method = getattr(Loop, method)
+        nodes = []
+        stack = [(prefix, self, False)]
+        while stack:
+            node = stack.pop()
+            nodes.append(node)
+            prefix, loop, overridden = node
+            if overridden:
+                continue
+            children = [
+                (prefix + k + ".", v, not _is_default_hook(getattr(v, method), base_method))
+                for k, v in loop.__dict__.items()
+                if isinstance(v, Loop)
+            ]
+            # reversed so the children are visited in their definition order
+            stack.extend(reversed(children))
+        return nodes
 
     def _load_from_state_dict(
         self, state_dict: Dict, prefix: str, restart_progress: bool, metrics: Optional[Dict[str, Metric]] = None
@@ -214,18 +270,22 @@ class Loop(ABC):
             key = prefix + k
             if isinstance(v, BaseProgress):
                 v.load_state_dict(state_dict[key])
-                if restart_progress:
-                    apply_to_collection(v, Progress, lambda p: p.current.reset_on_restart())
-
-            elif (
-                isinstance(v, ResultCollection)
-                and self.trainer is not None
-                and getattr(self.trainer, "lightning_module", None) is not None
-            ):
+                if not restart_progress:
+                    continue
+                if type(v) in _RESET_ON_RESTART_TYPES:
+                    v.reset_on_restart()
+                else:
+                    _reset_progress_on_restart(v)
+
+            elif isinstance(v, ResultCollection):
+                # the `trainer` property raises if this loop isn't attached, it never returns `None`
+                trainer = self.trainer
+                lightning_module = getattr(trainer, "lightning_module", None)
+                if lightning_module is None:
+                    continue
+
                 metric_attributes = {
-                    name: module
-                    for name, module in self.trainer.lightning_module.named_modules()
-                    if isinstance(module, Metric)
+                    name: module for name, module in lightning_module.named_modules() if isinstance(module, Metric)
                 }
                 if metrics:
                     metric_attributes.update(metrics)
@@ -236,11 +296,17 @@ class Loop(ABC):
                 # On reload, we need to re-attach the `Metric`s back to the `ResultCollection`.
                 # The references are provided through the `metric_attributes` dictionary.
                 v.load_state_dict(
-                    state_dict[prefix + k], metrics=metric_attributes, sync_fn=self.trainer.training_type_plugin.reduce
+                    state_dict[key], metrics=metric_attributes, sync_fn=trainer.training_type_plugin.reduce
                 )
 
-                if not self.trainer.is_global_zero:
+                if not trainer.is_global_zero:
                     v.reset(metrics=False)
 
         self.on_load_checkpoint(state_dict[prefix + "state_dict"])
         self.restarting = True
+
+
+def _is_default_hook(hook: Callable, default: Callable) -> bool:
+    """Checks whether the bound ``hook`` is the given default implementation, i.e. it was not overridden by the
+    subclass nor replaced on the instance."""
+    return getattr(hook, "__func__", None) is default
@@ -12,7 +12,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from collections import OrderedDict
 from functools import lru_cache
 from typing import Any, Dict, Iterator, Optional, Union
 
@@ -217,7 +216,7 @@ class EvaluationEpochLoop(Loop):
             the keyword arguments to pass to the step function
         """
         # make dataloader_idx arg in validation_step optional
-        step_kwargs = OrderedDict([("batch", batch), ("batch_idx", batch_idx)])
+        step_kwargs = {"batch": batch, "batch_idx": batch_idx}
 
         multiple_val_loaders = not self.trainer.testing and self._num_dataloaders > 1
         multiple_test_loaders = self.trainer.testing and self._num_dataloaders > 1
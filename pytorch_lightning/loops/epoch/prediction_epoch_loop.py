@@ -1,4 +1,3 @@
-from collections import OrderedDict
 from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import torch
@@ -153,7 +152,7 @@ class PredictionEpochLoop(Loop):
         Returns:
             the dictionary containing all the keyboard arguments for the predict step
         """
-        step_kwargs = OrderedDict([("batch", batch), ("batch_idx", batch_idx)])
+        step_kwargs = {"batch": batch, "batch_idx": batch_idx}
         if self._num_dataloaders > 1:
             step_kwargs["dataloader_idx"] = dataloader_idx
         return step_kwargs
@@ -52,6 +52,8 @@ class TrainingEpochLoop(loops.Loop):
 
         self._results = ResultCollection(training=True)
         self._epoch_output: Optional[List[List[STEP_OUTPUT]]] = None
+        # whether `training_epoch_end` is overridden, resolved once per run instead of once per batch
+        self._training_epoch_end_overridden: bool = False
 
     @property
     def total_batch_idx(self) -> int:
@@ -109,6 +111,7 @@ class TrainingEpochLoop(loops.Loop):
         self.trainer.call_hook("on_train_epoch_start")
         self.trainer.fit_loop.epoch_progress.increment_started()
 
+        self._training_epoch_end_overridden = is_overridden("training_epoch_end", self.trainer.lightning_module)
         self.dataloader_iter = _prepare_dataloader_iter(dataloader_iter, self.batch_idx + 1)
 
     def advance(self, *args: Any, **kwargs: Any) -> None:
@@ -267,8 +270,7 @@ class TrainingEpochLoop(loops.Loop):
         self, epoch_output: List[List[STEP_OUTPUT]], batch_end_outputs: STEP_OUTPUT
     ) -> None:
         """Adds the batch outputs to the epoch outputs and prepares reduction."""
-        hook_overridden = is_overridden("training_epoch_end", self.trainer.lightning_module)
-        if not hook_overridden:
+        if not self._training_epoch_end_overridden:
             return
 
         # track the outputs to reduce at the end of the epoch
@@ -11,7 +11,6 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from collections import OrderedDict
 from contextlib import contextmanager
 from typing import Any, Dict, Generator, Iterator, Mapping, Optional, Sequence, Tuple
 
@@ -134,7 +133,7 @@ def _build_training_step_kwargs(
         the keyword arguments for the training step
     """
     # enable not needing to add opt_idx to training_step
-    step_kwargs = OrderedDict([("batch", batch)])
+    step_kwargs = {"batch": batch}
 
     training_step_fx = getattr(lightning_module, "training_step")
 
@@ -11,8 +11,9 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from dataclasses import asdict, dataclass, field
-from typing import Type
+from collections.abc import Mapping, Sequence
+from dataclasses import asdict, dataclass, field, is_dataclass
+from typing import Any, Type
 
 
 @dataclass
@@ -46,6 +47,10 @@ class ReadyCompletedTracker(BaseProgress):
     ready: int = 0
     completed: int = 0
 
+    def state_dict(self) -> dict:
+        # the trackers only hold integers so there's no need for the recursive copy done by `asdict`
+        return self.__dict__.copy()
+
     def reset(self) -> None:
         """Reset the state."""
         self.ready = 0
@@ -149,6 +154,15 @@ class Progress(BaseProgress):
         """Utility function to easily create an instance from keyword arguments to both ``Tracker``s."""
         return cls(total=tracker_cls(**kwargs), current=tracker_cls(**kwargs))
 
+    def reset_on_restart(self) -> None:
+        self.current.reset_on_restart()
+
+    def state_dict(self) -> dict:
+        if type(self) not in (Progress, DataLoaderProgress, SchedulerProgress):
+            # subclasses may add fields, which only the default implementation knows about
+            return super().state_dict()
+        return {"total": self.total.state_dict(), "current": self.current.state_dict()}
+
     def load_state_dict(self, state_dict: dict) -> None:
         self.total.load_state_dict(state_dict["total"])
         self.current.load_state_dict(state_dict["current"])
@@ -198,6 +212,15 @@ class OptimizerProgress(BaseProgress):
         self.step.current.reset()
         self.zero_grad.current.reset()
 
+    def reset_on_restart(self) -> None:
+        self.step.reset_on_restart()
+        self.zero_grad.reset_on_restart()
+
+    def state_dict(self) -> dict:
+        if type(self) is not OptimizerProgress:
+            return super().state_dict()
+        return {"step": self.step.state_dict(), "zero_grad": self.zero_grad.state_dict()}
+
     def load_state_dict(self, state_dict: dict) -> None:
         self.step.load_state_dict(state_dict["step"])
         self.zero_grad.load_state_dict(state_dict["zero_grad"])
@@ -223,6 +246,39 @@ class OptimizationProgress(BaseProgress):
     def reset_on_epoch(self) -> None:
         self.optimizer.reset_on_epoch()
 
+    def reset_on_restart(self) -> None:
+        self.optimizer.reset_on_restart()
+
+    def state_dict(self) -> dict:
+        if type(self) is not OptimizationProgress:
+            return super().state_dict()
+        return {"optimizer": self.optimizer.state_dict(), "optimizer_idx": self.optimizer_idx}
+
     def load_state_dict(self, state_dict: dict) -> None:
         self.optimizer.load_state_dict(state_dict["optimizer"])
         self.optimizer_idx = state_dict["optimizer_idx"]
+
+
+# the progress classes whose ``reset_on_restart`` resets all the :class:`Progress` they hold and nothing else. Their
+# subclasses may add fields, so these are matched by exact type
+_RESET_ON_RESTART_TYPES = (Progress, DataLoaderProgress, SchedulerProgress, OptimizerProgress, OptimizationProgress)
+
+
+def _reset_progress_on_restart(data: Any) -> None:
+    """Resets the current progress of all the :class:`Progress` instances found in ``data`` on restart.
+
+    This matches ``apply_to_collection(data, Progress, lambda p: p.current.reset_on_restart())`` but does not
+    rebuild the traversed collections and dataclasses. Trackers found outside of a :class:`Progress` are not reset.
+    Used for the custom progress dataclasses, the classes in ``_RESET_ON_RESTART_TYPES`` are reset directly.
+    """
+    if isinstance(data, Progress):
+        data.current.reset_on_restart()
+    elif isinstance(data, Mapping):
+        for v in data.values():
+            _reset_progress_on_restart(v)
+    elif isinstance(data, Sequence) and not isinstance(data, str):
+        for v in data:
+            _reset_progress_on_restart(v)
+    elif is_dataclass(data) and not isinstance(data, type):
+        for name in data.__dataclass_fields__:
+            _reset_progress_on_restart(getattr(data, name))
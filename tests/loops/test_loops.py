@@ -83,6 +83,30 @@ def test_connect_loops_recursive():
     assert child1.trainer is trainer
 
 
+def test_connect_loops_overridden_trainer_setter():
+    """Test that a child loop overriding the `trainer` setter is connected through it, along with its children."""
+
+    class CustomTrainerLoop(NestedLoop):
+        @Loop.trainer.setter
+        def trainer(self, trainer):
+            self.connected = True
+            Loop.trainer.fset(self, trainer)
+
+    main_loop = NestedLoop()
+    child0 = CustomTrainerLoop()
+    child1 = NestedLoop()
+    grandchild = NestedLoop()
+    child0.connect(grandchild, None)
+    main_loop.connect(child0, child1)
+
+    trainer = Trainer()
+    main_loop.trainer = trainer
+    assert child0.connected
+    assert child0.trainer is trainer
+    assert child1.trainer is trainer
+    assert grandchild.trainer is trainer
+
+
 def test_connect_subloops(tmpdir):
     """Test connecting individual subloops by calling `trainer.x.y.connect()`"""
     model = BoringModel()
@@ -250,6 +274,110 @@ def test_loop_hierarchy():
     assert state_dict == {"state_dict": {"a": 1}, "progress": {"increment": 1}}
 
 
+def test_loop_state_dict_overridden_in_child():
+    """Test that the `state_dict` and `load_state_dict` overrides of a child loop are called by its parent."""
+
+    class CustomStateLoop(NestedLoop):
+        def __init__(self):
+            super().__init__()
+            self.loaded = None
+
+        def state_dict(self, destination=None, prefix=""):
+            destination = super().state_dict(destination, prefix)
+            destination[prefix + "custom"] = 1
+            return destination
+
+        def load_state_dict(self, state_dict, prefix="", restart_progress=True, metrics=None):
+            super().load_state_dict(state_dict, prefix, restart_progress, metrics)
+            self.loaded = state_dict[prefix + "custom"]
+
+    main_loop = NestedLoop()
+    child0 = CustomStateLoop()
+    grandchild = NestedLoop()
+    child0.connect(grandchild, None)
+    main_loop.connect(child0, NestedLoop())
+
+    state_dict = main_loop.state_dict()
+    assert state_dict == {
+        "state_dict": {},
+        "child_loop0.state_dict": {},
+        "child_loop0.child_loop0.state_dict": {},
+        "child_loop0.custom": 1,
+        "child_loop1.state_dict": {},
+    }
+
+    main_loop.load_state_dict(state_dict)
+    assert child0.loaded == 1
+    assert child0.restarting
+    assert grandchild.restarting
+
+
+def test_loop_state_dict_replaced_on_child_instance():
+    """Test that the `state_dict` and `load_state_dict` replaced on a child loop instance are called by its parent."""
+    main_loop = NestedLoop()
+    child0 = NestedLoop()
+    main_loop.connect(child0, NestedLoop())
+
+    with mock.patch.object(child0, "state_dict", return_value={}) as state_dict_mock:
+        state_dict = main_loop.state_dict()
+    state_dict_mock.assert_called_once_with(state_dict, "child_loop0.")
+    assert state_dict == {"state_dict": {}, "child_loop1.state_dict": {}}
+
+    with mock.patch.object(child0, "load_state_dict") as load_state_dict_mock:
+        main_loop.load_state_dict(state_dict)
+    load_state_dict_mock.assert_called_once_with(state_dict, "child_loop0.", True)
+    assert not child0.restarting
+
+
+def test_loop_stop_iteration_in_done():
+    """Test that a `StopIteration` raised by `done` is not handled by `run`."""
+
+    class Simple(Loop):
+        @property
+        def done(self) -> bool:
+            raise StopIteration
+
+        def reset(self) -> None:
+            pass
+
+        def advance(self) -> None:
+            pass
+
+        def on_run_end(self) -> None:
+            raise AssertionError("`on_run_end` should not be called")
+
+    with pytest.raises(StopIteration):
+        Simple().run()
+
+
+def test_loop_hooks_replaced_on_instance():
+    """Test that the default hooks replaced on the loop instance are still called by `run`."""
+
+    class Simple(Loop):
+        def __init__(self):
+            super().__init__()
+            self.count = 0
+
+        @property
+        def done(self) -> bool:
+            return self.count == 2
+
+        def reset(self) -> None:
+            self.count = 0
+
+        def advance(self, *args, **kwargs) -> None:
+            self.count += 1
+
+    loop = Simple()
+    loop.on_run_start = mock.Mock()
+    loop.on_advance_start = mock.Mock()
+    loop.on_advance_end = mock.Mock()
+    loop.run(1, a=2)
+    loop.on_run_start.assert_called_once_with(1, a=2)
+    assert loop.on_advance_start.mock_calls == [mock.call(1, a=2)] * 2
+    assert loop.on_advance_end.call_count == 2
+
+
 @mock.patch.dict(os.environ, {"PL_FAULT_TOLERANT_TRAINING": "1"})
 @pytest.mark.parametrize("stop_epoch", (1, 2))
 @pytest.mark.parametrize("stop_batch", (1, 2))
@@ -12,16 +12,20 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from copy import deepcopy
+from dataclasses import asdict, dataclass, field
+from typing import Dict, List
 
 import pytest
 
 from pytorch_lightning.trainer.progress import (
     BaseProgress,
+    OptimizationProgress,
     OptimizerProgress,
     ProcessedTracker,
     Progress,
     ReadyCompletedTracker,
     StartedTracker,
+    _reset_progress_on_restart,
 )
 
 
@@ -41,6 +45,77 @@ def test_tracker_reset_on_restart():
     assert t == ProcessedTracker(ready=3, started=3, processed=3, completed=3)
 
 
+def test_progress_reset_on_restart():
+    p = Progress.from_defaults(ProcessedTracker, ready=4, started=4, processed=3, completed=2)
+    p.reset_on_restart()
+    # only the current progress is reset
+    assert p.total == ProcessedTracker(ready=4, started=4, processed=3, completed=2)
+    assert p.current == ProcessedTracker(ready=3, started=3, processed=3, completed=3)
+
+    p = OptimizationProgress()
+    p.optimizer.step.increment_ready()
+    p.optimizer.zero_grad.increment_ready()
+    p.optimizer.zero_grad.increment_started()
+    p.reset_on_restart()
+    assert p.optimizer.step.current == ReadyCompletedTracker()
+    assert p.optimizer.step.total == ReadyCompletedTracker(ready=1)
+    assert p.optimizer.zero_grad.current == StartedTracker()
+    assert p.optimizer.zero_grad.total == StartedTracker(ready=1, started=1)
+
+
+def test_reset_progress_on_restart():
+    # trackers outside of a `Progress` are not reset
+    t = StartedTracker(ready=3, started=3, completed=2)
+    _reset_progress_on_restart(t)
+    assert t == StartedTracker(ready=3, started=3, completed=2)
+
+    @dataclass
+    class CustomProgress(BaseProgress):
+        tracker: StartedTracker = field(default_factory=StartedTracker)
+        progress_list: List[Progress] = field(default_factory=list)
+        progress_dict: Dict[str, Progress] = field(default_factory=dict)
+
+    p = CustomProgress(
+        tracker=StartedTracker(ready=1),
+        progress_list=[Progress.from_defaults(StartedTracker, ready=1)],
+        progress_dict={"a": Progress.from_defaults(StartedTracker, ready=2, started=1)},
+    )
+    _reset_progress_on_restart(p)
+    assert p.tracker == StartedTracker(ready=1)
+    assert p.progress_list[0].total == StartedTracker(ready=1)
+    assert p.progress_list[0].current == StartedTracker()
+    assert p.progress_dict["a"].total == StartedTracker(ready=2, started=1)
+    assert p.progress_dict["a"].current == StartedTracker(ready=1, started=1)
+
+
+@pytest.mark.parametrize(
+    "progress",
+    (
+        ProcessedTracker(ready=4, started=3, processed=2, completed=1),
+        Progress.from_defaults(ProcessedTracker, ready=2, started=1),
+        OptimizationProgress(optimizer_idx=1),
+    ),
+)
+def test_progress_state_dict(progress):
+    state_dict = progress.state_dict()
+    assert state_dict == asdict(progress)
+    assert type(progress).from_state_dict(state_dict) == progress
+
+
+@pytest.mark.parametrize("progress_cls", (Progress, OptimizerProgress, OptimizationProgress))
+def test_progress_state_dict_subclass_fields(progress_cls):
+    """Test that the fields added by subclasses of the built-in progress classes are saved."""
+
+    @dataclass
+    class CustomProgress(progress_cls):
+        is_last_batch: bool = False
+
+    progress = CustomProgress(is_last_batch=True)
+    state_dict = progress.state_dict()
+    assert state_dict == asdict(progress)
+    assert state_dict["is_last_batch"]
+
+
 @pytest.mark.parametrize("attr", ("ready", "started", "processed", "completed"))
 def test_progress_increment(attr):
     p = Progress()